@@ -1,14 +1,66 @@
 from collections import defaultdict
 import random
-from typing import List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
 
 from battleship.errors import AlreadyFiredError
 from battleship.ship import Ship, ShipPiece, ShipType
 
+if TYPE_CHECKING:
+    from battleship.placement import AdaptivePlacement  # noqa: F401
+
 BOARD_NUM_ROWS = 8
 BOARD_NUM_COLS = 8
 
 
+def _build_glyphs(
+        censored: bool) -> Dict[Tuple[bool, Optional[ShipType]], str]:
+    """Returns what to show for a cell, keyed by
+    (has been attempted, type of the ship on it or None)
+    """
+    # empty and a miss
+    glyphs: Dict[Tuple[bool, Optional[ShipType]], str] = {
+        (False, None): ".", (True, None): "⚪"}
+    for ship_type in ShipType:
+        # TODO: if this is your own ship, then show
+        # 2 characters with ship label + some sort of X
+        glyphs[(True, ship_type)] = "🔴"
+        glyphs[(False, ship_type)] = "." if censored else ship_type.value[0]
+    return glyphs
+
+
+_GLYPHS = {True: _build_glyphs(True), False: _build_glyphs(False)}
+_CURSOR = "✈️"
+_HEADER = "\t" + "".join(f"{col}\t" for col in range(BOARD_NUM_COLS)) + "\n"
+
+
+def bounds_error(row: int, col: int) -> Optional[str]:
+    """Returns why a position is off the board, or None if it is on it"""
+    if row >= BOARD_NUM_ROWS:
+        return f"{row} is too big, must be less than {BOARD_NUM_ROWS}"
+    if col >= BOARD_NUM_COLS:
+        return f"{col} is too big, must be less than {BOARD_NUM_COLS}"
+    if row < 0:
+        return f"{row} must be greater than or equal to 0"
+    if col < 0:
+        return f"{col} must be greater than or equal to 0"
+    return None
+
+
+def surrounding_positions(
+        positions: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+    """Returns the in bound positions above, below, to the left
+    and to the right of a list of positions
+    """
+    # return a set to we don't return the same spot twice
+    result = set()
+    for row, col in positions:
+        for spot in ((row - 1, col), (row + 1, col),
+                     (row, col - 1), (row, col + 1)):
+            if bounds_error(*spot) is None:
+                result.add(spot)
+    return result
+
+
 class BoardCell:
     def __init__(self):
         """Creates an empty cell on the board"""
@@ -20,7 +72,7 @@ class BoardCell:
         self.ship_piece = ship_piece
         self.ship = ship
 
-    def fire(self) -> Tuple[int, int]:
+    def fire(self) -> Tuple[bool, bool]:
         if self.has_been_attempted():
             raise AlreadyFiredError
         self.attempted_hit = True
@@ -44,6 +96,9 @@ class BoardCell:
     def has_ship(self) -> bool:
         return not self.empty()
 
+    def ship_type(self) -> Optional[ShipType]:
+        return None if self.empty() else self.ship_piece.ship_type
+
     def show(self, censored=True):
         """Shows the cell
 
@@ -59,26 +114,20 @@ class BoardCell:
             O if you fired at it and there was not a piece of a ship there
             X if you fired at it and there was a piece of a ship there
         """
-        if self.has_been_attempted() and self.empty():
-            # miss
-            return "⚪"
-        if self.empty():
-            return "."
-
-        if self.has_been_attempted() and self.has_ship():
-            # TODO: if this is your own ship, then return
-            # 2 characters with ship label + some sort of X
-            return "🔴"
-
-        if not self.has_been_attempted() and self.has_ship():
-            if censored:
-                return "."
-            else:
-                return str(self.ship_piece)
+        return _GLYPHS[censored][(self.has_been_attempted(), self.ship_type())]
 
 
 class Board:
-    def __init__(self):
+    def __init__(self, placement: Optional['AdaptivePlacement'] = None):
+        """Creates a board with all the ships on it
+
+        Parameters
+        ----------
+        placement : `battleship.placement.AdaptivePlacement`, optional
+            Where to place the ships. They are placed uniformly at random
+            if not given
+        """
+        self.placement = placement
         self.ships = [
             Ship(ShipType.CARRIER),
             Ship(ShipType.BATTLESHIP),
@@ -87,6 +136,12 @@ class Board:
             Ship(ShipType.DESTROYER),
         ]
         self.game_board = self._generate_game_board(self.ships)
+        # rendered rows for censored and uncensored views, None when
+        # the row has changed since it was last rendered
+        self._rows: Dict[bool, List[Optional[str]]] = {
+            censored: [None] * BOARD_NUM_ROWS for censored in (True, False)}
+        # whole rendered boards, keyed by (censored, cursor position)
+        self._frames: Dict[Tuple[bool, Optional[Tuple[int, int]]], str] = {}
 
     def show(self, cursor_row, cursor_col,
              censored: bool = True, show_cursor: bool = False) -> str:
@@ -101,43 +156,41 @@ class Board:
         -------
         str
             A string representing the board
+
+        Notes
+        -----
+        Rendered rows are cached, so cells must be fired at with
+        `Board.fire` for the change to show up
         """
-        out = "\t"
-        for col in range(BOARD_NUM_COLS):
-            out += f"{col}\t"
-        out += "\n"
-        for row_index in range(BOARD_NUM_ROWS):
-            out += f"{row_index}\t"
-            row_array = self.game_board[row_index]
-            output_array = []
-            for col_index, board_cell in enumerate(row_array):
-                # show plane icon if it is the opponent board and
-                # the position is where cursor is at
-                if (show_cursor is True and row_index == cursor_row and
-                        col_index == cursor_col):
-                    # show plane
-                    output_array.append("✈️")
-                else:
-                    output_array.append(board_cell.show(censored=censored))
-            out += '\t'.join(output_array)
-            out += "\n\n"
-        return out
+        cursor = None
+        if show_cursor is True and self.is_in_bound(cursor_row, cursor_col):
+            cursor = (cursor_row, cursor_col)
+        key = (censored, cursor)
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = self._render(censored, cursor)
+            self._frames[key] = frame
+        return frame
 
     def is_in_bound(self, row: int, col: int) -> bool:
-        return 0 <= row < BOARD_NUM_ROWS and 0 <= col < BOARD_NUM_COLS
+        return bounds_error(row, col) is None
+
+    def fire(self, row: int, col: int) -> Tuple[bool, bool]:
+        """Fires at a cell, returning (is_hit, is_ship_down)"""
+        result = self.game_board[row][col].fire()
+        for censored_rows in self._rows.values():
+            censored_rows[row] = None
+        self._frames.clear()
+        return result
+
+    def all_ships_down(self) -> bool:
+        return all([s.is_destroyed() for s in self.ships])
 
     def is_valid_move(self, row: int, col: int) -> Tuple[bool, Optional[str]]:
         # first check if is out of bounds
-        if row >= BOARD_NUM_ROWS:
-            return (False, f"{row} is too big, must be "
-                           f"less than {BOARD_NUM_ROWS}")
-        if col >= BOARD_NUM_COLS:
-            return (False, f"{col} is too big, must be "
-                           f"less than {BOARD_NUM_COLS}")
-        if row < 0:
-            return (False, f"{row} must be greater than or equal to 0")
-        if col < 0:
-            return (False, f"{col} must be greater than or equal to 0")
+        err = bounds_error(row, col)
+        if err is not None:
+            return (False, err)
 
         # now make sure cell hasn't been fired at already
         board_cell = self.game_board[row][col]
@@ -146,7 +199,8 @@ class Board:
         return (is_valid, err)
 
     def surrounding_positions(
-            self, positions: List[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+            self,
+            positions: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
         """Returns a list of positions that surround a given a list of positions
 
         Notes
@@ -154,25 +208,35 @@ class Board:
         Will only return valid moves that are above, below, to the left,
         or to the right
         """
-        # return a set to we don't return the same spot twice
-        result = set()
-        spots_to_check = []
-        for row, col in positions:
-            # spot above
-            spots_to_check.append((row - 1, col))
-            # spot below
-            spots_to_check.append((row + 1, col))
-            # spot to left
-            spots_to_check.append((row, col - 1))
-            # spot to right
-            spots_to_check.append((row, col + 1))
-        # now for each spot, make sure it is valid
-        # if so, return as a surrounding position
-        for row, col in spots_to_check:
-            in_bounds = self.is_in_bound(row, col)
-            if in_bounds:
-                result.add((row, col))
-        return result
+        return surrounding_positions(positions)
+
+    def _render(self, censored: bool,
+                cursor: Optional[Tuple[int, int]]) -> str:
+        cached_rows = self._rows[censored]
+        rows: List[str] = []
+        for row_index, row in enumerate(cached_rows):
+            if row is None:
+                row = self._render_row(row_index, censored)
+                cached_rows[row_index] = row
+            rows.append(row)
+        if cursor is None:
+            return _HEADER + "".join(rows)
+
+        # show plane icon where the cursor is at
+        cursor_row, cursor_col = cursor
+        cursor_line = self._render_row(cursor_row, censored, cursor_col)
+        return (_HEADER + "".join(rows[:cursor_row]) + cursor_line +
+                "".join(rows[cursor_row + 1:]))
+
+    def _render_row(self, row_index: int, censored: bool,
+                    cursor_col: Optional[int] = None) -> str:
+        glyphs = _GLYPHS[censored]
+        output_array = [
+            glyphs[(board_cell.attempted_hit, board_cell.ship_type())]
+            for board_cell in self.game_board[row_index]]
+        if cursor_col is not None:
+            output_array[cursor_col] = _CURSOR
+        return f"{row_index}\t" + "\t".join(output_array) + "\n\n"
 
     # Start methods to generate a random game board with ships on it
     def _generate_game_board(self, ships: List[Ship]) -> List[List[BoardCell]]:
@@ -190,6 +254,12 @@ class Board:
 
     def _place_ships_on_game_board(self, board: List[List[BoardCell]],
                                    ships: List[Ship]):
+        if self.placement is not None:
+            layout = self.placement.sample_layout()
+            for ship, (row, col, position) in zip(ships, layout):
+                self._place_ship_at_position(board, ship, row, col, position)
+            return
+
         def place_ship_on_game_board(board, ship):
             # key: tuple of (row, col, position)
             # value: bool on if we've attempted to place this ship here
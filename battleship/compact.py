@@ -0,0 +1,434 @@
+from array import array
+import random
+import sys
+from typing import (
+    Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union,
+    TYPE_CHECKING)
+
+from battleship.board import (
+    Board, BOARD_NUM_ROWS, BOARD_NUM_COLS, bounds_error, surrounding_positions)
+from battleship.errors import (
+    AlreadyFiredError, InvalidMoveError, InvalidSlotError, PoolExhaustedError)
+from battleship.ship import Ship, ShipType
+
+if TYPE_CHECKING:
+    from battleship.placement import AdaptivePlacement  # noqa: F401
+    from battleship.player import Player  # noqa: F401
+
+_SHIP_TYPES = list(ShipType)
+_NUM_CELLS = BOARD_NUM_ROWS * BOARD_NUM_COLS
+
+# each cell is a single byte. The low bits hold the index of the ship
+# on the cell plus one (0 means the cell is empty), the next bit is set
+# once the cell has been fired at
+_SHIP_MASK = 0b0111
+_ATTEMPTED = 0b1000
+
+# state of a board with no ships on it and nothing fired at
+_EMPTY_STATE = bytes(_NUM_CELLS) + bytes(
+    ship_type.value[1] for ship_type in _SHIP_TYPES)
+
+StateBuffer = Union[bytearray, memoryview]
+
+
+class CompactBoard:
+    """A board stored as a flat run of bytes instead of cell objects
+
+    The first BOARD_NUM_ROWS * BOARD_NUM_COLS bytes hold one cell each,
+    row by row. The remaining bytes hold how many pieces of each ship
+    (in `ShipType` order) have not been hit yet.
+
+    It supports the same moves as `battleship.board.Board`, so
+    `battleship.player.Player` and `battleship.player.CPUPlayer` can
+    play on it directly.
+    """
+    NUM_BYTES = len(_EMPTY_STATE)
+
+    __slots__ = ('_state',)
+
+    def __init__(self, state: Optional[StateBuffer] = None,
+                 place_ships: bool = True,
+                 placement: Optional['AdaptivePlacement'] = None):
+        """Creates a board on top of `state`
+
+        Parameters
+        ----------
+        state : bytearray or memoryview, optional
+            NUM_BYTES of writable memory to keep the board in,
+            e.g a slot of a `BoardPool`. A new buffer is allocated if
+            not given
+        place_ships : bool, optional
+            Whether to reset the board and place ships randomly. Pass False
+            to wrap a state that is already set up
+        placement : `battleship.placement.AdaptivePlacement`, optional
+            Where to place the ships. They are placed uniformly at random
+            if not given
+        """
+        if state is None:
+            state = bytearray(self.NUM_BYTES)
+        self._state = state
+        if place_ships:
+            self.reset(placement)
+
+    @classmethod
+    def from_board(cls, board: Board) -> 'CompactBoard':
+        """Creates a compact copy of a `battleship.board.Board`"""
+        compact = cls(place_ships=False)
+        state = compact._state
+        state[:] = _EMPTY_STATE
+        ship_indexes = {id(ship): index
+                        for index, ship in enumerate(board.ships)}
+        for row_index, row_array in enumerate(board.game_board):
+            for col_index, board_cell in enumerate(row_array):
+                cell = 0
+                if board_cell.has_ship():
+                    cell = ship_indexes[id(board_cell.ship)] + 1
+                if board_cell.has_been_attempted():
+                    cell |= _ATTEMPTED
+                state[row_index * BOARD_NUM_COLS + col_index] = cell
+        for index, ship in enumerate(board.ships):
+            state[_NUM_CELLS + index] = len(
+                [piece for piece in ship.pieces if not piece.hit])
+        return compact
+
+    def reset(self, placement: Optional['AdaptivePlacement'] = None):
+        """Clears the board and places all the ships
+
+        Ships are placed uniformly at random unless a placement is given
+        """
+        self._state[:] = _EMPTY_STATE
+        if placement is not None:
+            layout = placement.sample_layout()
+            for ship_index, (row, col, position) in enumerate(layout):
+                size = _SHIP_TYPES[ship_index].value[1]
+                for i in _cells(row, col, position, size):
+                    self._state[i] = ship_index + 1
+            return
+        for ship_index, ship_type in enumerate(_SHIP_TYPES):
+            self._place_ship(ship_index + 1, ship_type.value[1])
+
+    def fire(self, row: int, col: int) -> Tuple[bool, bool]:
+        """Fires at a cell, returning (is_hit, is_ship_down)
+
+        Raises
+        ------
+        `battleship.errors.InvalidMoveError`
+            If the cell is off the board
+        `battleship.errors.AlreadyFiredError`
+            If the cell has already been fired at
+        """
+        err = bounds_error(row, col)
+        if err is not None:
+            raise InvalidMoveError(err)
+        state = self._state
+        index = row * BOARD_NUM_COLS + col
+        cell = state[index]
+        if cell & _ATTEMPTED:
+            raise AlreadyFiredError
+        state[index] = cell | _ATTEMPTED
+
+        ship = cell & _SHIP_MASK
+        if not ship:
+            return (False, False)
+        health_index = _NUM_CELLS + ship - 1
+        state[health_index] -= 1
+        return (True, state[health_index] == 0)
+
+    def has_been_attempted(self, row: int, col: int) -> bool:
+        return bool(self._state[row * BOARD_NUM_COLS + col] & _ATTEMPTED)
+
+    def has_ship(self, row: int, col: int) -> bool:
+        return bool(self._state[row * BOARD_NUM_COLS + col] & _SHIP_MASK)
+
+    def ship_at(self, row: int, col: int) -> Optional[ShipType]:
+        ship = self._state[row * BOARD_NUM_COLS + col] & _SHIP_MASK
+        return _SHIP_TYPES[ship - 1] if ship else None
+
+    @property
+    def ships(self) -> List[Ship]:
+        """Returns the status of each ship, in `ShipType` order
+
+        The ships are built from the board's state each time, so they
+        are a snapshot to read from rather than something to play on.
+        """
+        ships = []
+        for index, ship_type in enumerate(_SHIP_TYPES):
+            ship = Ship(ship_type)
+            num_hit = ship.size - self._state[_NUM_CELLS + index]
+            for piece in ship.pieces[:num_hit]:
+                piece.hit = True
+            ships.append(ship)
+        return ships
+
+    def all_ships_down(self) -> bool:
+        return not any(self._state[_NUM_CELLS:])
+
+    def is_in_bound(self, row: int, col: int) -> bool:
+        return bounds_error(row, col) is None
+
+    def is_valid_move(self, row: int, col: int) -> Tuple[bool, Optional[str]]:
+        err = bounds_error(row, col)
+        if err is not None:
+            return (False, err)
+        if self.has_been_attempted(row, col):
+            return (False, 'cell has already been fired at')
+        return (True, None)
+
+    def surrounding_positions(
+            self,
+            positions: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        return surrounding_positions(positions)
+
+    def memory_footprint(self) -> int:
+        """Returns the number of bytes this board takes up
+
+        If the board lives in a pool, its share of the pool's buffer is
+        counted along with the memoryview that points into it.
+        """
+        return sys.getsizeof(self) + _state_footprint(self._state)
+
+    def _place_ship(self, ship: int, size: int):
+        state = self._state
+        # key: tuple of (row, col, position) we've already tried
+        attempted = set()
+        while True:
+            row = random.randint(0, BOARD_NUM_ROWS - 1)
+            col = random.randint(0, BOARD_NUM_COLS - 1)
+            position = random.choice(['vertical', 'horizontal'])
+
+            # optimization so we don't retry the same place twice
+            if (row, col, position) in attempted:
+                continue
+
+            if position == 'horizontal':
+                fits = col + size <= BOARD_NUM_COLS
+            else:
+                fits = row + size <= BOARD_NUM_ROWS
+            cells = _cells(row, col, position, size)
+
+            if fits and not any(state[i] for i in cells):
+                for i in cells:
+                    state[i] = ship
+                return
+            attempted.add((row, col, position))
+
+
+def _cells(row: int, col: int, position: str, size: int) -> range:
+    """Returns the indexes of the cells a ship placed at (row, col) covers"""
+    start = row * BOARD_NUM_COLS + col
+    if position == 'horizontal':
+        return range(start, start + size)
+    return range(start, start + size * BOARD_NUM_COLS, BOARD_NUM_COLS)
+
+
+def _state_footprint(state: StateBuffer) -> int:
+    """Returns the bytes a state buffer takes up, counting only its share
+    of the underlying buffer if it is a view into a pool
+    """
+    if isinstance(state, memoryview):
+        return sys.getsizeof(state) + state.nbytes
+    return sys.getsizeof(state)
+
+
+class HitLog:
+    """A player's recent successful hits stored as a run of bytes
+
+    Stands in for the `last_hits` list of a `battleship.player.Player`.
+    The first byte is the number of hits, the rest hold one flat cell
+    index per hit.
+    """
+    # a player can't have more hits in a row than there are ship pieces
+    MAX_HITS = sum(ship_type.value[1] for ship_type in _SHIP_TYPES)
+    NUM_BYTES = MAX_HITS + 1
+
+    __slots__ = ('_state',)
+
+    def __init__(self, state: Optional[StateBuffer] = None):
+        if state is None:
+            state = bytearray(self.NUM_BYTES)
+        self._state = state
+
+    def append(self, position: Tuple[int, int]):
+        count = self._state[0]
+        if count == self.MAX_HITS:
+            raise IndexError(f"can't keep more than {self.MAX_HITS} hits")
+        row, col = position
+        self._state[count + 1] = row * BOARD_NUM_COLS + col
+        self._state[0] = count + 1
+
+    def clear(self):
+        self._state[0] = 0
+
+    def __len__(self) -> int:
+        return self._state[0]
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for i in range(1, self._state[0] + 1):
+            yield divmod(self._state[i], BOARD_NUM_COLS)
+
+    def __contains__(self, position: object) -> bool:
+        return position in list(self)
+
+    def memory_footprint(self) -> int:
+        return sys.getsizeof(self) + _state_footprint(self._state)
+
+
+class _SlotPool:
+    """Preallocates fixed size rows of state in a single buffer
+
+    Rows are handed out as integer slots, so holding one costs the row's
+    bytes plus whatever the caller uses to remember the slot.
+    """
+    ROW_BYTES = 0
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buffer = bytearray(capacity * self.ROW_BYTES)
+        self._view = memoryview(self._buffer)
+        # stack of free slots, lowest slot on top
+        self._free = array('L', range(capacity - 1, -1, -1))
+        # 1 for every slot that has been acquired and not released
+        self._in_use = bytearray(capacity)
+
+    def release(self, slot: int):
+        """Returns a slot to the pool so it can be reused
+
+        Raises
+        ------
+        `battleship.errors.InvalidSlotError`
+            If the slot is not in the pool or is not in use
+        """
+        if not 0 <= slot < self.capacity:
+            raise InvalidSlotError(f"{slot} is not a slot in this pool")
+        if not self._in_use[slot]:
+            raise InvalidSlotError(f"slot {slot} is not in use")
+        self._in_use[slot] = 0
+        self._free.append(slot)
+
+    def in_use(self) -> int:
+        return self.capacity - len(self._free)
+
+    def memory_footprint(self) -> int:
+        """Returns the number of bytes the pool takes up"""
+        return (sys.getsizeof(self._buffer) + sys.getsizeof(self._free) +
+                sys.getsizeof(self._in_use) + sys.getsizeof(self))
+
+    def _take_slot(self) -> int:
+        if not self._free:
+            raise PoolExhaustedError(
+                f"all {self.capacity} slots are in use")
+        slot = self._free.pop()
+        self._in_use[slot] = 1
+        return slot
+
+    def _view_of(self, slot: int, offset: int, size: int) -> memoryview:
+        start = slot * self.ROW_BYTES + offset
+        return self._view[start:start + size]
+
+
+class BoardPool(_SlotPool):
+    """Preallocates the state of many `CompactBoard`s in a single buffer
+
+    `board` wraps a slot in a `CompactBoard` to play on.
+    """
+    ROW_BYTES = CompactBoard.NUM_BYTES
+
+    def acquire(self, placement: Optional['AdaptivePlacement'] = None) -> int:
+        """Reserves a slot with a freshly placed board and returns it
+
+        Raises
+        ------
+        `battleship.errors.PoolExhaustedError`
+            If every slot is in use
+        """
+        slot = self._take_slot()
+        self.board(slot).reset(placement)
+        return slot
+
+    def board(self, slot: int) -> CompactBoard:
+        return CompactBoard(self._view_of(slot, 0, self.ROW_BYTES),
+                            place_ships=False)
+
+    def memory_footprint_per_board(self) -> float:
+        """Returns the number of bytes the pool takes up per slot"""
+        return self.memory_footprint() / max(self.capacity, 1)
+
+
+class GamePool(_SlotPool):
+    """Preallocates everything a headless game keeps between moves
+
+    Each slot holds both players' boards and both players' `HitLog`, so a
+    live game costs ROW_BYTES of the pool and no Python objects. Boards,
+    hit logs and players are wrapped around a slot only while a move is
+    being played, e.g:
+
+        slot = pool.acquire()
+        player = pool.player(slot, 0, CPUPlayer)
+        target = pool.board(slot, 1)
+        player.make_move(target, *player.pick_move(target))
+
+    Player names, `battleship.ship.Ship` objects and the UI are not kept;
+    this is meant for CPU vs CPU play in simulations and hosting.
+    """
+    ROW_BYTES = 2 * (CompactBoard.NUM_BYTES + HitLog.NUM_BYTES)
+
+    def acquire(self, placement: Optional['AdaptivePlacement'] = None) -> int:
+        """Reserves a slot with two freshly placed boards and no hits
+
+        Raises
+        ------
+        `battleship.errors.PoolExhaustedError`
+            If every slot is in use
+        """
+        slot = self._take_slot()
+        for side in (0, 1):
+            self.board(slot, side).reset(placement)
+            self.hits(slot, side).clear()
+        return slot
+
+    def board(self, slot: int, side: int) -> CompactBoard:
+        """Returns the board owned by player `side` (0 or 1) of a game"""
+        offset = side * CompactBoard.NUM_BYTES
+        return CompactBoard(
+            self._view_of(slot, offset, CompactBoard.NUM_BYTES),
+            place_ships=False)
+
+    def hits(self, slot: int, side: int) -> HitLog:
+        """Returns the recent hits of player `side` (0 or 1) of a game"""
+        offset = 2 * CompactBoard.NUM_BYTES + side * HitLog.NUM_BYTES
+        return HitLog(self._view_of(slot, offset, HitLog.NUM_BYTES))
+
+    def player(self, slot: int, side: int,
+               strategy: Type['Player']) -> 'Player':
+        """Wraps player `side` (0 or 1) of a game in a `strategy` player
+        that plays on the pooled board and hit log
+        """
+        return strategy(self.board(slot, side), name=f"player {side}",
+                        last_hits=self.hits(slot, side))
+
+    def footprint_report(self) -> Dict[str, float]:
+        """Returns how many bytes the pool takes up per game, by part
+
+        Covers everything a live game keeps alive in the pool. The
+        wrappers made for a move are freed once it has been played, so
+        only `move_wrappers` is not held per game.
+        """
+        capacity = max(self.capacity, 1)
+        boards = 2 * CompactBoard.NUM_BYTES
+        hits = 2 * HitLog.NUM_BYTES
+        total = self.memory_footprint() / capacity
+        wrappers = 0
+        if self.capacity:
+            # wrapping a slot only reads it, so any slot will do
+            wrappers = sum(
+                wrapper.memory_footprint()
+                for side in (0, 1)
+                for wrapper in (self.board(0, side), self.hits(0, side))
+            ) - boards - hits
+        return {
+            'boards': boards,
+            'last_hits': hits,
+            'bookkeeping': total - boards - hits,
+            'total': total,
+            'move_wrappers': wrappers,
+        }
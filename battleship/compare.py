@@ -0,0 +1,271 @@
+"""Compare two CPU strategies by playing them against the same boards
+
+Each game generates one fleet layout with `battleship.board.Board` from a
+seed, and both strategies then play that layout with their random choices
+seeded the same way. The layout and play streams are derived separately
+from the game's seed, so the shots are independent of the layout. The
+harness watches the paired differences in shots-to-win and in head-to-head
+wins, and stops as soon as either is statistically clear instead of
+playing a fixed number of games.
+
+The stopping rule uses hedged capital betting confidence sequences
+(Waudby-Smith and Ramdas, "Estimating means of bounded random variables
+by betting", 2023). Both series are bounded, and the intervals adapt to
+how spread out the values actually are while staying valid no matter how
+many times they are checked.
+"""
+import math
+import random
+from typing import Callable, NamedTuple, Optional, Tuple
+
+from battleship.board import Board, BOARD_NUM_ROWS, BOARD_NUM_COLS
+from battleship.compact import CompactBoard
+from battleship.player import AnyBoard, Player
+from battleship.ship import ShipType
+
+# builds a player for a strategy given the board it owns
+StrategyFactory = Callable[[AnyBoard], Player]
+
+_MAX_SHOTS = BOARD_NUM_ROWS * BOARD_NUM_COLS
+# no game can be won in fewer shots than there are ship pieces
+_MIN_SHOTS = sum(ship_type.value[1] for ship_type in ShipType)
+
+# shot differences lie in [-(max - min), max - min]
+_MAX_SHOT_DIFFERENCE = _MAX_SHOTS - _MIN_SHOTS
+
+# largest fraction of the capital the confidence sequence bets on a
+# single value
+_MAX_BET = 0.75
+
+
+class ComparisonResult(NamedTuple):
+    """Outcome of `compare_strategies`
+
+    Shots are counted as strategy A minus strategy B, so a negative
+    mean_shot_difference means A needs fewer shots to win.
+    """
+    games: int
+    # 'a', 'b' or None if max_games was reached without a clear winner
+    winner: Optional[str]
+    mean_shot_difference: float
+    shot_difference_interval: Tuple[float, float]
+    # mean paired shot difference divided by its standard deviation
+    effect_size: float
+    # fraction of games A finished in fewer shots, ties count as half
+    win_rate: float
+    win_rate_interval: Tuple[float, float]
+
+
+def play_game(player: Player, board: AnyBoard) -> int:
+    """Has a player fire at a board until every ship is down
+
+    Returns
+    -------
+    int
+        The number of shots it took
+    """
+    for shots in range(1, _MAX_SHOTS + 1):
+        row, col = player.pick_move(board)
+        player.make_move(board, row, col)
+        if board.all_ships_down():
+            return shots
+    raise RuntimeError(f"{player} did not win within {_MAX_SHOTS} shots")
+
+
+def play_paired_game(strategy_a: StrategyFactory,
+                     strategy_b: StrategyFactory,
+                     seed: int) -> Tuple[int, int]:
+    """Plays both strategies against the same seeded fleet layout
+
+    Returns
+    -------
+    tuple of int
+        The number of shots strategy A and strategy B took to win
+    """
+    state = random.getstate()
+    try:
+        # separate streams for the layout and for play, otherwise the
+        # first shots replay the numbers that placed the ships
+        random.seed(f"{seed}:layout")
+        layout = Board()
+        shots = []
+        for strategy in (strategy_a, strategy_b):
+            random.seed(f"{seed}:player")
+            player = strategy(CompactBoard())
+            # reseed after building the player so both strategies
+            # see the same stream of random numbers while playing
+            random.seed(f"{seed}:play")
+            shots.append(play_game(player, CompactBoard.from_board(layout)))
+    finally:
+        random.setstate(state)
+    return (shots[0], shots[1])
+
+
+class ConfidenceSequence:
+    """Anytime-valid confidence intervals for the mean of bounded values
+
+    For every candidate mean on a grid it keeps the log capital of two
+    bettors, one betting that values come in above the candidate and one
+    that they come in below. Each bets a Kelly-style fraction based on the
+    mean and variance of the values seen so far. A candidate is ruled out
+    once the hedged capital reaches 1 / alpha.
+
+    Values are added one at a time and only running sums are kept, so
+    each update costs the same however many values have been added. The
+    interval holds at level 1 - alpha simultaneously for every number of
+    values, so it can be checked after each one, and it narrows with the
+    observed spread of the values rather than the width of their range.
+    """
+
+    def __init__(self, low: float, high: float, alpha: float,
+                 resolution: float):
+        """
+        Parameters
+        ----------
+        low, high : float
+            Bounds every value is known to lie in
+        alpha : float
+            Chance that the interval ever misses the true mean
+        resolution : float
+            Spacing of the candidate means, which the interval is
+            reported to
+        """
+        self.low = low
+        self.high = high
+        self.n = 0
+        num_points = round((high - low) / resolution) + 1
+        # candidate means, scaled to [0, 1]
+        self._grid = [i / (num_points - 1) for i in range(num_points)]
+        self._log_up = [0.0] * num_points
+        self._log_down = [0.0] * num_points
+        # capital is split evenly between the two bettors
+        self._log_threshold = math.log(1 / alpha) - math.log(0.5)
+        # running mean and sum of squared deviations of the raw values
+        self._mean = 0.0
+        self._m2 = 0.0
+        # estimates the bets are based on, over the values scaled to
+        # [0, 1]. They start from 1/2 and 1/4 as if one value had
+        # already been seen
+        self._scaled_mean = 0.5
+        self._scaled_m2 = 0.25
+
+    def add(self, value: float):
+        x = (value - self.low) / (self.high - self.low)
+        t = self.n + 1
+        # bets only use the values before this one
+        predicted_mean = self._scaled_mean
+        predicted_variance = self._scaled_m2 / t
+        log_up = self._log_up
+        log_down = self._log_down
+        for i, m in enumerate(self._grid):
+            d = predicted_mean - m
+            kelly = d / (predicted_variance + d * d)
+            # bets are capped so a value at the far bound can't take all
+            # the capital, no cap is needed when no value can be below
+            # (or above) the candidate
+            if kelly > 0:
+                bet = min(kelly, _MAX_BET / m) if m > 0 else kelly
+                log_up[i] += math.log1p(bet * (x - m))
+            elif kelly < 0:
+                bet = min(-kelly, _MAX_BET / (1 - m)) if m < 1 else -kelly
+                log_down[i] += math.log1p(-bet * (x - m))
+
+        self._scaled_mean += (x - self._scaled_mean) / (t + 1)
+        self._scaled_m2 += (x - self._scaled_mean) ** 2
+
+        delta = value - self._mean
+        self._mean += delta / t
+        self._m2 += delta * (value - self._mean)
+        self.n = t
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self._m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+    def interval(self) -> Tuple[float, float]:
+        """Returns the smallest and largest candidate means not ruled out"""
+        kept = [m for m, up, down in zip(self._grid, self._log_up,
+                                         self._log_down)
+                if max(up, down) < self._log_threshold]
+        if not kept:
+            return (self._mean, self._mean)
+        width = self.high - self.low
+        return (self.low + width * kept[0], self.low + width * kept[-1])
+
+
+def compare_strategies(strategy_a: StrategyFactory,
+                       strategy_b: StrategyFactory,
+                       confidence: float = 0.95,
+                       min_games: int = 30,
+                       max_games: int = 10000,
+                       seed: int = 0) -> ComparisonResult:
+    """Plays paired games until one strategy is clearly better
+
+    Parameters
+    ----------
+    strategy_a, strategy_b : callable
+        Build a player given the board it owns,
+        e.g `battleship.player.CPUPlayer`
+    confidence : float, optional
+        How sure we need to be before stopping. Split evenly between
+        the shots-to-win test and the win rate test
+    min_games : int, optional
+        Number of games to play before checking whether to stop. The
+        intervals are valid without it, it only guards against stopping
+        on a handful of games
+    max_games : int, optional
+        Number of games to give up after
+    seed : int, optional
+        Seed of the first game, game i uses seed + i
+
+    Returns
+    -------
+    `ComparisonResult`
+    """
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be between 0 and 1, "
+                         f"got {confidence}")
+    if not 2 <= min_games <= max_games:
+        raise ValueError("min_games must be at least 2 and "
+                         "no more than max_games")
+    # each of the two tests gets half of the error budget
+    alpha = (1 - confidence) / 2
+
+    shot_differences = ConfidenceSequence(
+        -_MAX_SHOT_DIFFERENCE, _MAX_SHOT_DIFFERENCE, alpha, resolution=1)
+    wins = ConfidenceSequence(0, 1, alpha, resolution=0.01)
+    winner = None
+    for game in range(max_games):
+        shots_a, shots_b = play_paired_game(strategy_a, strategy_b,
+                                            seed + game)
+        shot_differences.add(shots_a - shots_b)
+        if shots_a == shots_b:
+            wins.add(0.5)
+        else:
+            wins.add(1.0 if shots_a < shots_b else 0.0)
+
+        if shot_differences.n < min_games:
+            continue
+        low, high = shot_differences.interval()
+        win_low, win_high = wins.interval()
+        if high < 0 or win_low > 0.5:
+            winner = 'a'
+        elif low > 0 or win_high < 0.5:
+            winner = 'b'
+        if winner is not None:
+            break
+
+    std = shot_differences.stdev
+    return ComparisonResult(
+        games=shot_differences.n,
+        winner=winner,
+        mean_shot_difference=shot_differences.mean,
+        shot_difference_interval=shot_differences.interval(),
+        effect_size=shot_differences.mean / std if std else 0.0,
+        win_rate=wins.mean,
+        win_rate_interval=wins.interval(),
+    )
@@ -8,3 +8,11 @@ class InvalidBoardError(RuntimeError):
 
 class InvalidMoveError(RuntimeError):
     pass
+
+
+class PoolExhaustedError(RuntimeError):
+    pass
+
+
+class InvalidSlotError(RuntimeError):
+    pass
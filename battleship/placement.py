@@ -0,0 +1,174 @@
+import json
+import random
+from typing import List, Tuple
+
+from battleship.board import BOARD_NUM_ROWS, BOARD_NUM_COLS, bounds_error
+from battleship.errors import InvalidMoveError
+from battleship.ship import ShipType
+
+# (row, col, position) of the first piece of a ship, like
+# `battleship.board.Board._place_ship_at_position` takes
+Placement = Tuple[int, int, str]
+
+# lowest weight a cell can get, so every layout stays possible
+_MIN_CELL_WEIGHT = 0.01
+
+
+class ShotHeatmap:
+    """Keeps track of which cells opponents fire at first
+
+    The heat of a cell is a decaying average of how early it was fired at
+    in the recorded games: 1 if it was the first shot, falling to 0 if it
+    was the last one or never fired at.
+    """
+
+    def __init__(self, decay: float = 0.95):
+        """
+        Parameters
+        ----------
+        decay : float, optional
+            How much of the old heat to keep when a game is recorded.
+            Lower values forget old games faster
+        """
+        self.decay = decay
+        self.games = 0
+        # bumped on every change so samplers know to rebuild their index
+        self.version = 0
+        self.heat: List[List[float]] = [
+            [0.0] * BOARD_NUM_COLS for _ in range(BOARD_NUM_ROWS)]
+
+    def record_game(self, shots: List[Tuple[int, int]]):
+        """Adds the shots an opponent took in one game, in order
+
+        Raises
+        ------
+        `battleship.errors.InvalidMoveError`
+            If a shot is off the board or the same cell is fired at twice.
+            The heatmap is left unchanged
+        """
+        num_cells = BOARD_NUM_ROWS * BOARD_NUM_COLS
+        earliness = [[0.0] * BOARD_NUM_COLS for _ in range(BOARD_NUM_ROWS)]
+        for shot_index, (row, col) in enumerate(shots):
+            err = bounds_error(row, col)
+            if err is not None:
+                raise InvalidMoveError(err)
+            if earliness[row][col]:
+                raise InvalidMoveError(
+                    f"{row},{col} was fired at more than once")
+            # at most one shot per cell, so this stays above 0
+            earliness[row][col] = 1 - shot_index / num_cells
+
+        # the first game replaces the empty map rather than decaying into it
+        keep = self.decay if self.games else 0.0
+        for row in range(BOARD_NUM_ROWS):
+            for col in range(BOARD_NUM_COLS):
+                self.heat[row][col] = (keep * self.heat[row][col] +
+                                       (1 - keep) * earliness[row][col])
+        self.games += 1
+        self.version += 1
+
+    def save(self, path: str):
+        with open(path, 'w') as f:
+            json.dump({'decay': self.decay, 'games': self.games,
+                       'heat': self.heat}, f)
+
+    @classmethod
+    def load(cls, path: str) -> 'ShotHeatmap':
+        with open(path) as f:
+            data = json.load(f)
+        heatmap = cls(decay=data['decay'])
+        heatmap.games = data['games']
+        heatmap.heat = data['heat']
+        return heatmap
+
+
+class AdaptivePlacement:
+    """Places ships where a `ShotHeatmap` says opponents fire late
+
+    Every possible placement of every ship is listed up front, together
+    with a bitmask of the cells it covers and cumulative weights for
+    sampling. A layout is then a handful of weighted draws plus bitmask
+    overlap checks.
+
+    Building the index takes around a millisecond, so it is never done
+    while sampling. `record_game` rebuilds it right away. If the heatmap
+    is changed some other way, call `refresh` once it is done.
+    """
+
+    def __init__(self, heatmap: ShotHeatmap):
+        self.heatmap = heatmap
+        self._index_version = -1
+        self._index: List[Tuple[List[Tuple[int, Placement]],
+                                List[float]]] = []
+        self.refresh()
+
+    def record_game(self, shots: List[Tuple[int, int]]):
+        """Adds an opponent's shots to the heatmap and rebuilds the index"""
+        self.heatmap.record_game(shots)
+        self.refresh()
+
+    def is_stale(self) -> bool:
+        """Whether the heatmap has changed since the index was built"""
+        return self._index_version != self.heatmap.version
+
+    def sample_layout(self) -> List[Placement]:
+        """Returns a placement for every ship, in `ShipType` order"""
+        while True:
+            occupied = 0
+            layout = []
+            for placements, cum_weights in self._index:
+                # a few draws nearly always find a free spot,
+                # otherwise start the layout over
+                for _ in range(20):
+                    mask, placement = random.choices(
+                        placements, cum_weights=cum_weights)[0]
+                    if not mask & occupied:
+                        break
+                else:
+                    break
+                occupied |= mask
+                layout.append(placement)
+            else:
+                return layout
+
+    def refresh(self):
+        """Rebuilds the placement index from the heatmap"""
+        cell_weights = [
+            [max(1 - heat, _MIN_CELL_WEIGHT) for heat in row_heat]
+            for row_heat in self.heatmap.heat]
+        self._index = []
+        for ship_type in ShipType:
+            size = ship_type.value[1]
+            placements = []
+            cum_weights = []
+            total = 0.0
+            for row, col, position in _all_placements(size):
+                mask = 0
+                weight = 1.0
+                positions = _ship_positions(row, col, position, size)
+                for cell_row, cell_col in positions:
+                    mask |= 1 << (cell_row * BOARD_NUM_COLS + cell_col)
+                    weight *= cell_weights[cell_row][cell_col]
+                total += weight
+                placements.append((mask, (row, col, position)))
+                cum_weights.append(total)
+            self._index.append((placements, cum_weights))
+        self._index_version = self.heatmap.version
+
+
+def _all_placements(size: int) -> List[Placement]:
+    placements = []
+    for row in range(BOARD_NUM_ROWS):
+        for col in range(BOARD_NUM_COLS):
+            if col + size <= BOARD_NUM_COLS:
+                placements.append((row, col, 'horizontal'))
+            if row + size <= BOARD_NUM_ROWS:
+                placements.append((row, col, 'vertical'))
+    return placements
+
+
+def _ship_positions(row: int, col: int, position: str,
+                    size: int) -> List[Tuple[int, int]]:
+    if position == 'horizontal':
+        return [(row, col + i) for i in range(size)]
+    return [(row + i, col) for i in range(size)]
@@ -1,37 +1,43 @@
 from abc import ABC
 import random
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 from battleship.board import Board, BOARD_NUM_ROWS, BOARD_NUM_COLS
+from battleship.compact import CompactBoard, HitLog
 from battleship.errors import InvalidBoardError, InvalidMoveError
 from battleship.ship import Ship
 
 _LIST_OF_NAMES = ['Will Turner', 'Elizabeth Swann']
 
+# players can play on either kind of board
+AnyBoard = Union[Board, CompactBoard]
+# players can keep their hits in a list or in pooled memory
+AnyHits = Union[List[Tuple[int, int]], HitLog]
+
 
 class Player(ABC):
-    def __init__(self, board: Board, name: str = None):
+    def __init__(self, board: AnyBoard, name: str = None,
+                 last_hits: AnyHits = None):
         self.name = name or self._generate_name()
         self.board = board
         # keep track of the last succesful hits
-        self.last_hits: List[Tuple[int, int]] = []
+        self.last_hits: AnyHits = [] if last_hits is None else last_hits
 
-    def pick_move(self, board: Board) -> Tuple[int, int]:
+    def pick_move(self, board: AnyBoard) -> Tuple[int, int]:
         pass
 
-    def make_move(self, board: Board, row: int, col: int):
-        board_cell = board.game_board[row][col]
-        is_hit, is_ship_down = board_cell.fire()
+    def make_move(self, board: AnyBoard, row: int, col: int):
+        is_hit, is_ship_down = board.fire(row, col)
         if is_hit:
             self.last_hits.append((row, col))
         if is_ship_down:
             # once we've taken a ship down, can forget about the last hit
             # you've made. Time to search elsewhere
-            self.last_hits = []
+            self.last_hits.clear()
         return (is_hit, is_ship_down)
 
     def all_ships_down(self) -> bool:
-        return all([s.is_destroyed() for s in self.ships()])
+        return self.board.all_ships_down()
 
     def ships(self) -> List[Ship]:
         return self.board.ships
@@ -44,7 +50,7 @@ class Player(ABC):
 
 
 class HumanPlayer(Player):
-    def validate_move(self, board: Board,
+    def validate_move(self, board: AnyBoard,
                       row: int, col: int):
         """Validtes the human move on a board
         Paramters
@@ -81,7 +87,7 @@ class HumanPlayer(Player):
 
 
 class CPUPlayer(Player):
-    def pick_move(self, board: Board) -> Tuple[int, int]:
+    def pick_move(self, board: AnyBoard) -> Tuple[int, int]:
         """CPU logic to pick a move"""
         # if we are flying blind, just go for anything
         if len(self.last_hits) == 0:
@@ -98,10 +104,10 @@ class CPUPlayer(Player):
                 return (row, col)
 
         # no valid surrounding moves, so reset the last hits
-        self.last_hits = []
+        self.last_hits.clear()
         return self.pick_move(board)
 
-    def _pick_random_move(self, board: Board) -> Tuple[int, int]:
+    def _pick_random_move(self, board: AnyBoard) -> Tuple[int, int]:
         while True:
             row = random.randint(0, BOARD_NUM_ROWS)
             col = random.randint(0, BOARD_NUM_COLS)
@@ -0,0 +1,215 @@
+"""Opt-in profiling for headless and batch runs
+
+`HotPathTimer` counts calls and time spent in the code paths simulations
+spend most of their time in. `SamplingProfiler` periodically samples the
+stack of the thread it was started from and can write it out in the
+collapsed format flamegraph tools read. Neither costs anything unless it
+is used, e.g:
+
+    with HotPathTimer() as timer, SamplingProfiler() as sampler:
+        compare_strategies(CPUPlayer, MyPlayer)
+    print(timer.summary())
+    print(sampler.summary())
+    open('run.folded', 'w').write(sampler.collapsed())
+"""
+from collections import Counter, defaultdict
+import cProfile
+import functools
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from battleship.board import Board, BoardCell
+from battleship.compact import CompactBoard
+from battleship.player import CPUPlayer
+
+# (class, method name) of the code paths HotPathTimer wraps, on top of
+# the strategies' pick_move
+_HOT_PATHS = [
+    (Board, '__init__'),
+    (CompactBoard, 'reset'),
+    (BoardCell, 'fire'),
+    (CompactBoard, 'fire'),
+    (Board, 'all_ships_down'),
+    (CompactBoard, 'all_ships_down'),
+]
+
+
+class HotPathTimer:
+    """Counts calls to and time spent in the simulation hot paths
+
+    The hot paths are only wrapped while the timer is in use as a context
+    manager. Recursive calls are not counted separately, their calls and
+    time are counted once against the outermost call.
+
+    `pick_move` is timed for `battleship.player.CPUPlayer` and for each of
+    its subclasses that overrides it, as they exist when the timer is
+    entered. Strategies that don't subclass CPUPlayer can be passed in.
+    """
+
+    def __init__(self, strategies: Iterable[type] = ()):
+        """
+        Parameters
+        ----------
+        strategies : iterable of classes, optional
+            Other player classes whose `pick_move` should be timed
+        """
+        self.strategies = list(strategies)
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self._depth: Dict[str, int] = defaultdict(int)
+        self._originals: List[Tuple[type, str, Callable]] = []
+
+    def __enter__(self) -> 'HotPathTimer':
+        for cls, name in _HOT_PATHS + self._strategy_paths():
+            original = cls.__dict__[name]
+            self._originals.append((cls, name, original))
+            setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", original))
+        return self
+
+    def __exit__(self, *exc_info):
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals = []
+
+    def summary(self) -> str:
+        """Returns a table of calls and time per hot path, slowest first"""
+        lines = [f"{'hot path':<30}{'calls':>10}{'total s':>12}"
+                 f"{'per call us':>14}"]
+        slowest_first = sorted(self.calls,
+                               key=lambda label: -self.seconds[label])
+        for label in slowest_first:
+            calls = self.calls[label]
+            seconds = self.seconds[label]
+            lines.append(f"{label:<30}{calls:>10}{seconds:>12.4f}"
+                         f"{seconds / calls * 1e6:>14.2f}")
+        return "\n".join(lines)
+
+    def _strategy_paths(self) -> List[Tuple[type, str]]:
+        strategies = [CPUPlayer] + _subclasses(CPUPlayer) + self.strategies
+        # dict keeps the first of any duplicates, in order
+        return [(cls, 'pick_move') for cls in dict.fromkeys(strategies)
+                if 'pick_move' in cls.__dict__]
+
+    def _wrap(self, label: str, func: Callable) -> Callable:
+        calls = self.calls
+        seconds = self.seconds
+        depth = self._depth
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if depth[label] == 0:
+                calls[label] += 1
+            depth[label] += 1
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                depth[label] -= 1
+                if depth[label] == 0:
+                    seconds[label] += time.perf_counter() - start
+        return wrapper
+
+
+class SamplingProfiler:
+    """Samples the stack of the thread it is entered from
+
+    A background thread looks at the stack every `interval` seconds while
+    the profiler is in use as a context manager. The sampler needs the GIL
+    to take a sample, so the interpreter's switch interval
+    (`sys.getswitchinterval`, 5ms by default) is lowered to `interval`
+    while sampling and restored afterwards. Otherwise samples could not
+    be taken more often than the switch interval.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self._switch_interval: Optional[float] = None
+        # stacks are tuples of frame labels, outermost frame first
+        self.stacks: Counter = Counter()
+        self._thread_id: Optional[int] = None
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    def __enter__(self) -> 'SamplingProfiler':
+        self._thread_id = threading.get_ident()
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+        self._sampler.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        if self._switch_interval is not None:
+            sys.setswitchinterval(self._switch_interval)
+
+    def collapsed(self) -> str:
+        """Returns the samples as collapsed stacks, one
+        `frame;frame;frame count` line per stack, for flamegraph tools
+        """
+        return "\n".join(f"{';'.join(stack)} {count}"
+                         for stack, count in sorted(self.stacks.items()))
+
+    def summary(self, limit: int = 20) -> str:
+        """Returns a table of the functions with the most samples
+
+        Self samples are the ones where the function was running, total
+        samples the ones where it was anywhere on the stack.
+        """
+        self_samples: Counter = Counter()
+        total_samples: Counter = Counter()
+        for stack, count in self.stacks.items():
+            self_samples[stack[-1]] += count
+            for label in set(stack):
+                total_samples[label] += count
+
+        num_samples = sum(self.stacks.values()) or 1
+        lines = [f"{'self %':>8}{'total %':>9}  function"]
+        for label, count in self_samples.most_common(limit):
+            lines.append(f"{100 * count / num_samples:>8.1f}"
+                         f"{100 * total_samples[label] / num_samples:>9.1f}"
+                         f"  {label}")
+        return "\n".join(lines)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}"
+                             f":{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+
+
+def _subclasses(cls: type) -> List[type]:
+    """Returns every subclass of a class, however far down"""
+    result: List[type] = []
+    subclasses: List[type] = cls.__subclasses__()
+    for subclass in subclasses:
+        result.append(subclass)
+        result.extend(_subclasses(subclass))
+    return result
+
+
+def cprofile_summary(func: Callable, *args, limit: int = 20,
+                     **kwargs) -> str:
+    """Runs a function under cProfile and returns its per-function summary,
+    sorted by cumulative time
+    """
+    profiler = cProfile.Profile()
+    profiler.runcall(func, *args, **kwargs)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(
+        limit)
+    return out.getvalue()
@@ -1,6 +1,10 @@
+import pytest
+
 from unittest import mock
 
 from battleship import board
+from battleship.errors import AlreadyFiredError
+from battleship.ship import Ship, ShipType
 
 
 def test_board_is_valid_move():
@@ -24,3 +28,68 @@ def test_board_is_valid_move():
         with mock.patch('battleship.board.BOARD_NUM_COLS', 8):
             assert b.is_valid_move(2, 3)[0] is True
             assert b.is_valid_move(0, 0)[0] is True
+
+
+def test_board_fire():
+    b = board.Board()
+    ship = b.ships[-1]
+    positions = [(r, c) for r in range(board.BOARD_NUM_ROWS)
+                 for c in range(board.BOARD_NUM_COLS)
+                 if b.game_board[r][c].ship is ship]
+    assert len(positions) == ship.size
+
+    assert b.fire(*positions[0]) == (True, False)
+    assert b.fire(*positions[1]) == (True, True)
+    with pytest.raises(AlreadyFiredError):
+        b.fire(*positions[0])
+
+
+def test_board_all_ships_down():
+    b = board.Board()
+    assert b.all_ships_down() is False
+    for r in range(board.BOARD_NUM_ROWS):
+        for c in range(board.BOARD_NUM_COLS):
+            b.fire(r, c)
+    assert b.all_ships_down() is True
+
+
+def _expected_show(b, censored, cursor=None):
+    out = "\t" + "".join(f"{col}\t" for col in range(board.BOARD_NUM_COLS))
+    out += "\n"
+    for r, row_array in enumerate(b.game_board):
+        cells = [board_cell.show(censored=censored)
+                 for board_cell in row_array]
+        if cursor is not None and cursor[0] == r:
+            cells[cursor[1]] = "✈️"
+        out += f"{r}\t" + "\t".join(cells) + "\n\n"
+    return out
+
+
+def test_board_cell_show():
+    cell = board.BoardCell()
+    assert cell.show() == "."
+    ship = Ship(ShipType.DESTROYER)
+    cell.set_ship(ship.pieces[0], ship)
+    assert cell.show(censored=True) == "."
+    assert cell.show(censored=False) == str(ship.pieces[0])
+    cell.fire()
+    assert cell.show() == "🔴"
+
+    empty = board.BoardCell()
+    empty.fire()
+    assert empty.show() == "⚪"
+
+
+def test_board_show():
+    b = board.Board()
+    assert b.show(0, 0) == _expected_show(b, True)
+    assert b.show(0, 0, censored=False) == _expected_show(b, False)
+    assert b.show(2, 3, show_cursor=True) == _expected_show(b, True, (2, 3))
+    # cursors off the board are not shown
+    assert b.show(8, 0, show_cursor=True) == _expected_show(b, True)
+
+    # firing updates the cached rendering
+    b.fire(2, 4)
+    b.fire(5, 5)
+    assert b.show(2, 3, show_cursor=True) == _expected_show(b, True, (2, 3))
+    assert b.show(0, 0, censored=False) == _expected_show(b, False)
@@ -0,0 +1,180 @@
+import pytest
+
+from battleship import board, compact
+from battleship.errors import (
+    AlreadyFiredError, InvalidMoveError, InvalidSlotError, PoolExhaustedError)
+from battleship.player import CPUPlayer
+from battleship.ship import ShipType
+
+
+def _all_positions():
+    return [(r, c) for r in range(board.BOARD_NUM_ROWS)
+            for c in range(board.BOARD_NUM_COLS)]
+
+
+def test_compact_board_places_every_ship():
+    b = compact.CompactBoard()
+    ships = [b.ship_at(r, c) for r, c in _all_positions()]
+    for ship_type in ShipType:
+        assert ships.count(ship_type) == ship_type.value[1]
+
+
+def test_compact_board_fire():
+    b = compact.CompactBoard()
+    positions = [p for p in _all_positions()
+                 if b.ship_at(*p) == ShipType.DESTROYER]
+    empty = next(p for p in _all_positions() if not b.has_ship(*p))
+
+    assert b.fire(*empty) == (False, False)
+    assert b.fire(*positions[0]) == (True, False)
+    assert b.fire(*positions[1]) == (True, True)
+    assert b.is_valid_move(*positions[0]) == (
+        False, 'cell has already been fired at')
+    with pytest.raises(AlreadyFiredError):
+        b.fire(*positions[0])
+
+
+def test_compact_board_fire_out_of_bounds():
+    b = compact.CompactBoard()
+    for row, col in [(8, 0), (0, 8), (-1, 0), (0, -1)]:
+        with pytest.raises(InvalidMoveError):
+            b.fire(row, col)
+    # the ships' health was not touched
+    assert [ship.is_destroyed() for ship in b.ships] == [False] * 5
+
+
+def test_compact_board_ships():
+    b = compact.CompactBoard()
+    for position in _all_positions():
+        if b.ship_at(*position) == ShipType.DESTROYER:
+            b.fire(*position)
+    ships = b.ships
+    assert [ship.ship_type for ship in ships] == list(ShipType)
+    assert [ship.is_destroyed() for ship in ships] == [
+        False, False, False, False, True]
+
+
+def test_compact_board_from_board():
+    b = board.Board()
+    b.fire(0, 0)
+    c = compact.CompactBoard.from_board(b)
+    for r, col in _all_positions():
+        cell = b.game_board[r][col]
+        assert c.has_been_attempted(r, col) == cell.has_been_attempted()
+        ship_type = cell.ship.ship_type if cell.has_ship() else None
+        assert c.ship_at(r, col) == ship_type
+
+
+def test_cpu_player_wins_on_compact_board():
+    b = compact.CompactBoard()
+    p = CPUPlayer(compact.CompactBoard(), "Jack Sparrow")
+    for _ in range(len(_all_positions())):
+        p.make_move(b, *p.pick_move(b))
+        if b.all_ships_down():
+            break
+    assert b.all_ships_down() is True
+
+
+def test_board_pool():
+    pool = compact.BoardPool(2)
+    first = pool.acquire()
+    second = pool.acquire()
+    assert first != second
+    assert pool.in_use() == 2
+    with pytest.raises(PoolExhaustedError):
+        pool.acquire()
+
+    pool.board(first).fire(0, 0)
+    assert pool.board(first).has_been_attempted(0, 0) is True
+    assert pool.board(second).has_been_attempted(0, 0) is False
+
+    pool.release(first)
+    assert pool.acquire() == first
+    # a reused slot starts with a fresh board
+    assert pool.board(first).has_been_attempted(0, 0) is False
+
+
+def test_board_pool_bad_release():
+    pool = compact.BoardPool(2)
+    slot = pool.acquire()
+    pool.release(slot)
+    with pytest.raises(InvalidSlotError):
+        pool.release(slot)
+    with pytest.raises(InvalidSlotError):
+        pool.release(2)
+    with pytest.raises(InvalidSlotError):
+        pool.release(-1)
+
+    # a double release must not hand the same slot out twice
+    assert pool.acquire() != pool.acquire()
+    assert pool.in_use() == 2
+
+
+def test_hit_log():
+    hits = compact.HitLog()
+    assert len(hits) == 0
+    hits.append((1, 2))
+    hits.append((7, 7))
+    assert list(hits) == [(1, 2), (7, 7)]
+    assert (7, 7) in hits
+    hits.clear()
+    assert len(hits) == 0
+
+    for _ in range(compact.HitLog.MAX_HITS):
+        hits.append((0, 0))
+    with pytest.raises(IndexError):
+        hits.append((0, 0))
+
+
+def test_game_pool_cpu_game():
+    pool = compact.GamePool(3)
+    slot = pool.acquire()
+    winner = None
+    for _ in range(2 * len(_all_positions())):
+        for side in (0, 1):
+            # players are rebuilt around the pooled state every move
+            player = pool.player(slot, side, CPUPlayer)
+            target = pool.board(slot, 1 - side)
+            player.make_move(target, *player.pick_move(target))
+            if target.all_ships_down():
+                winner = side
+                break
+        if winner is not None:
+            break
+    assert winner is not None
+    # the loser's board is untouched by the other side's shots
+    assert pool.board(slot, winner).all_ships_down() is False
+
+    pool.release(slot)
+    slot = pool.acquire()
+    assert len(pool.hits(slot, 0)) == 0
+    assert pool.board(slot, 0).has_been_attempted(0, 0) is False
+
+
+def test_game_pool_keeps_hits_between_moves():
+    pool = compact.GamePool(1)
+    slot = pool.acquire()
+    player = pool.player(slot, 0, CPUPlayer)
+    target = pool.board(slot, 1)
+    hit = next(p for p in _all_positions() if target.has_ship(*p))
+    player.make_move(target, *hit)
+    assert list(pool.hits(slot, 0)) == [hit]
+    assert list(pool.player(slot, 0, CPUPlayer).last_hits) == [hit]
+
+
+def test_memory_footprint():
+    pool = compact.BoardPool(1000)
+    per_board = pool.memory_footprint_per_board()
+    assert per_board < 2 * compact.CompactBoard.NUM_BYTES
+    assert compact.CompactBoard().memory_footprint() < 200
+    # a pooled board counts the memoryview it holds
+    assert pool.board(0).memory_footprint() > (
+        compact.CompactBoard.NUM_BYTES + 150)
+
+    report = compact.GamePool(1000).footprint_report()
+    assert report['boards'] == 2 * compact.CompactBoard.NUM_BYTES
+    assert report['last_hits'] == 2 * compact.HitLog.NUM_BYTES
+    assert report['total'] < 200
+    assert report['total'] == pytest.approx(
+        report['boards'] + report['last_hits'] + report['bookkeeping'])
+    assert report['move_wrappers'] > 0
@@ -0,0 +1,114 @@
+from typing import List
+
+import pytest
+
+from battleship import compare
+from battleship.player import CPUPlayer
+
+
+class RandomPlayer(CPUPlayer):
+    """Ignores its previous hits and always fires at random"""
+    def pick_move(self, board):
+        return self._pick_random_move(board)
+
+
+class FirstShotPlayer(RandomPlayer):
+    """Records whether each game's first shot was a hit"""
+    first_shot_hits: List[bool] = []
+
+    def make_move(self, board, row, col):
+        is_first_shot = not hasattr(self, 'fired')
+        self.fired = True
+        is_hit, is_ship_down = super().make_move(board, row, col)
+        if is_first_shot:
+            self.first_shot_hits.append(is_hit)
+        return (is_hit, is_ship_down)
+
+
+def test_play_paired_game_is_reproducible():
+    first = compare.play_paired_game(CPUPlayer, RandomPlayer, seed=3)
+    second = compare.play_paired_game(CPUPlayer, RandomPlayer, seed=3)
+    assert first == second
+
+
+def test_play_paired_game_same_strategy_ties():
+    shots_a, shots_b = compare.play_paired_game(CPUPlayer, CPUPlayer, seed=3)
+    assert shots_a == shots_b
+
+
+def test_play_paired_game_first_shot_is_independent_of_layout():
+    FirstShotPlayer.first_shot_hits = []
+    for seed in range(1000):
+        compare.play_paired_game(FirstShotPlayer, RandomPlayer, seed)
+    hits = FirstShotPlayer.first_shot_hits
+    assert len(hits) == 1000
+    # 17 of the 64 cells have a piece of a ship on them
+    assert abs(sum(hits) / len(hits) - 17 / 64) < 0.05
+
+
+def test_confidence_sequence_narrows():
+    cs = compare.ConfidenceSequence(0, 4, 0.05, resolution=0.01)
+    assert cs.interval() == (0, 4)
+    for value in [1.0, 2.0, 3.0] * 10:
+        cs.add(value)
+    low, high = cs.interval()
+    assert 0 < low < 2 < high < 4
+    assert cs.mean == pytest.approx(2)
+    for value in [1.0, 2.0, 3.0] * 100:
+        cs.add(value)
+    low_more, high_more = cs.interval()
+    assert low < low_more < 2 < high_more < high
+
+
+def test_confidence_sequence_does_not_collapse():
+    # identical values must not give a zero width interval
+    cs = compare.ConfidenceSequence(0, 1, 0.025, resolution=0.01)
+    for _ in range(30):
+        cs.add(1.0)
+    low, high = cs.interval()
+    assert low < 1 == high
+    assert high - low > 0.1
+
+
+def test_shot_interval_excludes_zero_on_its_own():
+    # the shot differences are spread far less than their range allows,
+    # so their interval should not have to wait for the win rate
+    cs = compare.ConfidenceSequence(-compare._MAX_SHOT_DIFFERENCE,
+                                    compare._MAX_SHOT_DIFFERENCE, 0.025,
+                                    resolution=1)
+    for seed in range(100):
+        shots_a, shots_b = compare.play_paired_game(CPUPlayer, RandomPlayer,
+                                                    seed)
+        cs.add(shots_a - shots_b)
+        if cs.interval()[1] < 0:
+            break
+    assert cs.interval()[1] < 0
+    assert cs.n < 60
+
+
+def test_compare_strategies_stops_early():
+    result = compare.compare_strategies(CPUPlayer, RandomPlayer,
+                                        max_games=1000)
+    assert result.winner == 'a'
+    assert result.games < 1000
+    assert result.mean_shot_difference < 0
+    # stopped because one of the intervals excludes no difference
+    assert (result.shot_difference_interval[1] < 0 or
+            result.win_rate_interval[0] > 0.5)
+    assert result.effect_size < 0
+    assert result.win_rate > 0.5
+
+
+def test_compare_strategies_same_strategy():
+    result = compare.compare_strategies(CPUPlayer, CPUPlayer, max_games=50)
+    assert result.winner is None
+    assert result.games == 50
+    assert result.mean_shot_difference == 0
+
+
+def test_compare_strategies_validates_arguments():
+    with pytest.raises(ValueError):
+        compare.compare_strategies(CPUPlayer, CPUPlayer, confidence=1.5)
+    with pytest.raises(ValueError):
+        compare.compare_strategies(CPUPlayer, CPUPlayer,
+                                   min_games=10, max_games=5)
@@ -0,0 +1,94 @@
+import pytest
+
+from battleship import board, placement
+from battleship.errors import InvalidMoveError
+from battleship.compact import CompactBoard
+from battleship.ship import ShipType
+
+
+def _hot_left_half_heatmap():
+    heatmap = placement.ShotHeatmap()
+    # opponent always opens on the left half of the board
+    shots = [(r, c) for c in range(board.BOARD_NUM_COLS // 2)
+             for r in range(board.BOARD_NUM_ROWS)]
+    heatmap.record_game(shots)
+    return heatmap
+
+
+def test_heatmap_record_game():
+    heatmap = placement.ShotHeatmap(decay=0.5)
+    heatmap.record_game([(0, 0), (0, 1)])
+    assert heatmap.heat[0][0] == 1
+    assert 0 < heatmap.heat[0][1] < 1
+    assert heatmap.heat[1][1] == 0
+
+    # a game that never fires at (0, 0) halves its heat
+    heatmap.record_game([(1, 1)])
+    assert heatmap.heat[0][0] == 0.5
+    assert heatmap.heat[1][1] == 0.5
+    assert heatmap.games == 2
+
+
+def test_heatmap_record_game_rejects_bad_shots():
+    heatmap = placement.ShotHeatmap()
+    for shots in ([(-1, 0)], [(8, 0)], [(0, 8)], [(1, 1), (2, 2), (1, 1)]):
+        with pytest.raises(InvalidMoveError):
+            heatmap.record_game(shots)
+    assert heatmap.games == 0
+    assert all(heat == 0 for row in heatmap.heat for heat in row)
+
+    # firing at every cell once is fine
+    heatmap.record_game([(r, c) for r in range(board.BOARD_NUM_ROWS)
+                         for c in range(board.BOARD_NUM_COLS)])
+    assert min(min(row) for row in heatmap.heat) > 0
+
+
+def test_heatmap_save_and_load(tmp_path):
+    heatmap = _hot_left_half_heatmap()
+    path = str(tmp_path / 'heatmap.json')
+    heatmap.save(path)
+    loaded = placement.ShotHeatmap.load(path)
+    assert loaded.heat == heatmap.heat
+    assert loaded.games == heatmap.games
+    assert loaded.decay == heatmap.decay
+
+
+def test_sample_layout_is_valid():
+    sampler = placement.AdaptivePlacement(_hot_left_half_heatmap())
+    for _ in range(100):
+        b = CompactBoard(placement=sampler)
+        ships = [b.ship_at(r, c) for r in range(board.BOARD_NUM_ROWS)
+                 for c in range(board.BOARD_NUM_COLS)]
+        for ship_type in ShipType:
+            assert ships.count(ship_type) == ship_type.value[1]
+
+
+def test_sample_layout_avoids_early_shots():
+    sampler = placement.AdaptivePlacement(_hot_left_half_heatmap())
+    left = 0
+    for _ in range(100):
+        b = board.Board(placement=sampler)
+        for row_array in b.game_board:
+            for col, board_cell in enumerate(row_array):
+                if board_cell.has_ship() and col < board.BOARD_NUM_COLS // 2:
+                    left += 1
+    # uniform placement puts about half of the 1700 pieces on the left
+    assert left < 500
+
+
+def test_record_game_refreshes_index():
+    heatmap = placement.ShotHeatmap()
+    sampler = placement.AdaptivePlacement(heatmap)
+    assert sampler.is_stale() is False
+
+    sampler.record_game([(0, 0)])
+    assert heatmap.games == 1
+    assert sampler.is_stale() is False
+
+    # changes made straight to the heatmap wait for an explicit refresh
+    heatmap.record_game([(0, 1)])
+    assert sampler.is_stale() is True
+    sampler.sample_layout()
+    assert sampler.is_stale() is True
+    sampler.refresh()
+    assert sampler.is_stale() is False
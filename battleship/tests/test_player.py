@@ -31,36 +31,24 @@ def test_cpu_player_repr():
 
 def test_player_make_move(player_obj):
     other_board = mock.MagicMock()
-    cells = [mock.MagicMock() for i in range(4)]
-    other_board.game_board = [[cells[0], cells[1]], [cells[2], cells[3]]]
 
-    cell_to_fire = cells[3]
-    cell_to_fire.fire.return_value = (True, False)
+    other_board.fire.return_value = (True, False)
     assert player_obj.make_move(other_board, 1, 1) == (True, False)
+    other_board.fire.assert_called_with(1, 1)
     assert (1, 1) in player_obj.last_hits
 
-    cell_to_fire = cells[2]
-    cell_to_fire.fire.return_value = (False, False)
+    other_board.fire.return_value = (False, False)
     assert player_obj.make_move(other_board, 1, 0) == (False, False)
     assert (1, 0) not in player_obj.last_hits
 
-    cell_to_fire = cells[1]
-    cell_to_fire.fire.return_value = (True, True)
+    other_board.fire.return_value = (True, True)
     assert player_obj.make_move(other_board, 0, 1) == (True, True)
     assert len(player_obj.last_hits) == 0
 
 
 def test_player_all_ships_down(player_obj):
-    mock_ship_1 = mock.MagicMock()
-    mock_ship_2 = mock.MagicMock()
-    player_obj.board.ships = [mock_ship_1, mock_ship_2]
-
-    mock_ship_1.is_destroyed.return_value = False
-    mock_ship_2.is_destroyed.return_value = False
-    assert player_obj.all_ships_down() is False
-
-    mock_ship_2.is_destroyed.return_value = True
+    player_obj.board.all_ships_down.return_value = False
     assert player_obj.all_ships_down() is False
 
-    mock_ship_1.is_destroyed.return_value = True
+    player_obj.board.all_ships_down.return_value = True
     assert player_obj.all_ships_down() is True
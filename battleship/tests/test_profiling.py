@@ -0,0 +1,79 @@
+import sys
+
+from battleship import compare, profiling
+from battleship.board import Board, BoardCell
+from battleship.compact import CompactBoard
+from battleship.player import CPUPlayer
+
+
+def test_hot_path_timer():
+    original_fire = BoardCell.fire
+    with profiling.HotPathTimer() as timer:
+        b = Board()
+        player = CPUPlayer(CompactBoard(), "Jack Sparrow")
+        shots = compare.play_game(player, b)
+    assert BoardCell.fire is original_fire
+
+    assert timer.calls['Board.__init__'] == 1
+    assert timer.calls['BoardCell.fire'] == shots
+    assert timer.calls['Board.all_ships_down'] == shots
+    # recursive picks count as part of the outermost one
+    assert timer.calls['CPUPlayer.pick_move'] == shots
+    assert timer.seconds['CPUPlayer.pick_move'] > 0
+    assert 'CPUPlayer.pick_move' in timer.summary()
+
+
+class GreedyPlayer(CPUPlayer):
+    """Always fires at the first free cell"""
+    def pick_move(self, board):
+        return next((r, c) for r in range(8) for c in range(8)
+                    if board.is_valid_move(r, c)[0])
+
+
+class OtherPlayer:
+    def pick_move(self, board):
+        return (0, 0)
+
+
+def test_hot_path_timer_times_strategies():
+    original_pick_move = GreedyPlayer.pick_move
+    with profiling.HotPathTimer(strategies=[OtherPlayer]) as timer:
+        player = GreedyPlayer(CompactBoard(), "Greedy")
+        shots = compare.play_game(player, CompactBoard())
+        OtherPlayer().pick_move(None)
+    assert GreedyPlayer.pick_move is original_pick_move
+    assert timer.calls['GreedyPlayer.pick_move'] == shots
+    assert timer.calls['OtherPlayer.pick_move'] == 1
+    assert 'GreedyPlayer.pick_move' in timer.summary()
+
+
+def _busy_loop():
+    total = 0
+    for i in range(300000):
+        total += i
+    return total
+
+
+def test_sampling_profiler():
+    switch_interval = sys.getswitchinterval()
+    with profiling.SamplingProfiler(interval=0.0005) as sampler:
+        # lowered so the sampler can get the GIL often enough
+        assert sys.getswitchinterval() <= 0.0005
+        for _ in range(5):
+            _busy_loop()
+    assert sys.getswitchinterval() == switch_interval
+    assert sum(sampler.stacks.values()) > 0
+
+    lines = sampler.collapsed().splitlines()
+    assert any('test_profiling.py:_busy_loop' in line for line in lines)
+    for line in lines:
+        stack, count = line.rsplit(' ', 1)
+        assert int(count) > 0
+        assert 'test_profiling.py:test_sampling_profiler' in stack
+
+    assert 'test_profiling.py:_busy_loop' in sampler.summary()
+
+
+def test_cprofile_summary():
+    summary = profiling.cprofile_summary(Board)
+    assert '_generate_game_board' in summary